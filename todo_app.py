@@ -17,22 +17,72 @@ Uma lista de objetos com chaves:
 - `id` (int): identificador estável do item.
 - `task` (str): texto da tarefa.
 - `status` (str): `pending` | `in_progress` | `done`.
-- `done` (bool): compatibilidade/atalho; é sincronizado com `status`.
+- `done` (bool): compatibilidade/atalho; derivado de `status` ao salvar.
 """
 
 import json
+import os
+import queue
+import threading
+import traceback
 import tkinter as tk
 import tkinter.font as tkfont
+from collections import Counter
+from collections.abc import Callable, Iterable, Mapping
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from tkinter import messagebox, ttk
 from typing import Any, Literal, TypedDict
 
+try:
+    import orjson
+except ImportError:  # orjson é opcional; cai para o `json` da stdlib
+    orjson = None
+
 # Persist tasks alongside the script
 DATA_FILE = Path(__file__).with_name("tasks.json")
 
+# Proc Tcl que insere várias linhas no Treeview em uma única chamada Python → Tcl.
+# `rows` é uma lista plana: iid, values, tags, iid, values, tags, ...
+_BULK_INSERT_PROC = "::todo_app_bulk_insert"
+_BULK_INSERT_SCRIPT = (
+    "proc " + _BULK_INSERT_PROC + " {tree rows} {\n"
+    "    foreach {iid values tags} $rows {\n"
+    "        $tree insert {} end -id $iid -values $values -tags $tags\n"
+    "    }\n"
+    "}"
+)
+
 
 TaskStatus = Literal["pending", "in_progress", "done"]
 
+_VALID_STATUSES: frozenset[str] = frozenset(("pending", "in_progress", "done"))
+
+# Ciclo de status usado pelo duplo clique: pending → in_progress → done → pending
+_NEXT_STATUS: dict[str, TaskStatus] = {
+    "pending": "in_progress",
+    "in_progress": "done",
+    "done": "pending",
+}
+
+# Status → (rótulo exibido, tag do Treeview); status desconhecido é exibido como "done"
+STATUS_DISPLAY: dict[str, tuple[str, str]] = {
+    "pending": ("Pendente", "pending"),
+    "in_progress": ("Em andamento", "in_progress"),
+    "done": ("Feita", "done"),
+}
+
+# Prioridade → (rótulo exibido, tag do Treeview); prioridade desconhecida é exibida como "low"
+PRIORITY_DISPLAY: dict[str, tuple[str, str]] = {
+    "high": ("Alta", "priority_high"),
+    "medium": ("Média", "priority_medium"),
+    "low": ("Baixa", "priority_low"),
+}
+
+# Ordem de exibição por prioridade (high=0, medium=1, low=2); desconhecida conta como medium
+_PRIORITY_RANK: dict[str, int] = {"high": 0, "medium": 1, "low": 2}
+
 
 class Task(TypedDict, total=False):
     """Representa uma tarefa persistida em `tasks.json`."""
@@ -54,10 +104,16 @@ def calculate_stats(tasks: list[Task]) -> dict[str, int | float]:
     - done: número de tarefas concluídas
     - completion_percent: porcentagem de conclusão (0-100)
     """
-    total = len(tasks)
-    pending = sum(1 for t in tasks if t.get("status") == "pending")
-    in_progress = sum(1 for t in tasks if t.get("status") == "in_progress")
-    done = sum(1 for t in tasks if t.get("status") == "done")
+    # Uma única passada sobre a lista, contando todos os status de uma vez
+    counts = Counter(t.get("status") for t in tasks)
+    return _stats_from_counts(counts, len(tasks))
+
+
+def _stats_from_counts(counts: Mapping[str | None, int], total: int) -> dict[str, int | float]:
+    """Monta o dicionário de `calculate_stats` a partir da contagem por status."""
+    pending = counts.get("pending", 0)
+    in_progress = counts.get("in_progress", 0)
+    done = counts.get("done", 0)
     
     completion_percent = (done / total * 100) if total > 0 else 0
     
@@ -71,7 +127,7 @@ def calculate_stats(tasks: list[Task]) -> dict[str, int | float]:
 
 
 def filter_tasks(tasks: list[Task], status_filter: str | None, priority_filter: str | None, 
-                search_text: str) -> list[Task]:
+                search_text: str, text_lower: Mapping[int, str] | None = None) -> list[Task]:
     """Filtra tarefas baseado em status, prioridade e texto de busca.
     
     Parâmetros:
@@ -79,54 +135,145 @@ def filter_tasks(tasks: list[Task], status_filter: str | None, priority_filter:
         status_filter: Status para filtrar (None = todos, "pending", "in_progress", "done")
         priority_filter: Prioridade para filtrar (None = todas, "low", "medium", "high")
         search_text: Texto para buscar no título da tarefa (case-insensitive)
+        text_lower: Opcional; id → título já em minúsculas, para não repetir `.lower()`
     
     Retorna:
         Lista de tarefas filtradas
     """
-    result = []
     search_lower = search_text.lower().strip()
-    
-    for task in tasks:
-        # Aplicar filtro de status
-        if status_filter and task.get("status") != status_filter:
-            continue
-        
-        # Aplicar filtro de prioridade
-        if priority_filter and task.get("priority") != priority_filter:
-            continue
-        
-        # Aplicar filtro de texto
-        if search_lower:
-            task_text = task.get("task", "").lower()
-            if search_lower not in task_text:
-                continue
-        
-        result.append(task)
-    
-    return result
-
-
-def load_tasks() -> list[Task]:
-    """Carrega tarefas do arquivo JSON.
+    if not (status_filter or priority_filter or search_lower):
+        return list(tasks)
+    # A origem do título em minúsculas é escolhida uma vez, fora do laço
+    if text_lower is not None:
+        return [
+            t for t in tasks
+            if (not status_filter or t.get("status") == status_filter)
+            and (not priority_filter or t.get("priority") == priority_filter)
+            and (not search_lower or search_lower in text_lower[t["id"]])
+        ]
+    return [
+        t for t in tasks
+        if (not status_filter or t.get("status") == status_filter)
+        and (not priority_filter or t.get("priority") == priority_filter)
+        and (not search_lower or search_lower in t.get("task", "").lower())
+    ]
+
+
+# `fdatasync` só existe em alguns sistemas (ex.: Linux); nos demais, usa `fsync`
+_fdatasync = getattr(os, "fdatasync", os.fsync)
+
+# Cache de leitura: caminho → (mtime, tamanho, tarefas já parseadas). A lista em cache
+# nunca é entregue diretamente: cada leitura recebe cópias (ver `_read_tasks_file`).
+_load_cache: dict[str, tuple[float, int, list[Task]]] = {}
+
+
+def _read_tasks_file() -> list[Task]:
+    """Lê e parseia o arquivo JSON de tarefas.
 
     Retorna:
         Lista de tarefas. Se o arquivo não existir ou estiver inválido, retorna lista vazia.
 
     Observação:
         Se o JSON estiver corrompido, exibe um alerta e recria a base (retornando `[]`).
+        Se o arquivo não mudou (mesmo mtime e tamanho) desde a última leitura, os dados
+        já parseados são reaproveitados sem reler o arquivo. O chamador sempre recebe
+        cópias novas das tarefas, que pode alterar sem afetar o cache.
     """
     if DATA_FILE.exists():
+        st = DATA_FILE.stat()
+        key = str(DATA_FILE)
+        cached = _load_cache.get(key)
+        if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+            return [dict(t) for t in cached[2]]
         try:
-            data = json.loads(DATA_FILE.read_text(encoding="utf-8"))
-            return data if isinstance(data, list) else []
-        except json.JSONDecodeError:
+            if orjson is not None:
+                data = orjson.loads(DATA_FILE.read_bytes())
+            else:
+                data = json.loads(DATA_FILE.read_text(encoding="utf-8"))
+            data = data if isinstance(data, list) else []
+            _load_cache[key] = (st.st_mtime, st.st_size, data)
+            return [dict(t) for t in data]
+        except json.JSONDecodeError:  # `orjson.JSONDecodeError` é subclasse desta
             messagebox.showwarning("Aviso", "Arquivo de tarefas corrompido. Ele será recriado.")
     return []
 
 
+def load_tasks() -> tuple[list[Task], bool, int]:
+    """Carrega as tarefas do arquivo JSON já normalizadas para o formato atual.
+
+    A normalização é feita em uma única passada logo após a leitura:
+    - Se não houver `status`, deriva de `done`.
+    - Se não houver `priority`, define como "medium".
+    - `done` é removido da tarefa em memória: `status` é a única fonte de verdade e
+      `save_tasks` volta a gravar `done` a partir dele.
+
+    Retorna:
+        Tupla `(tarefas, needs_save, max_id)`; `needs_save` é `True` se alguma tarefa
+        foi alterada pela normalização e, portanto, precisa ser persistida; `max_id` é
+        o maior `id` encontrado (0 se não houver tarefas).
+    """
+    tasks = _read_tasks_file()
+    needs_save = False
+    max_id = 0
+    for task in tasks:
+        task_id = task.get("id", 0)
+        if task_id > max_id:
+            max_id = task_id
+        done = task.pop("done", False)
+        if not task.get("status"):
+            task["status"] = "done" if done else "pending"
+            needs_save = True
+        if "priority" not in task:
+            task["priority"] = "medium"
+            needs_save = True
+    return tasks, needs_save, max_id
+
+
 def save_tasks(tasks: list[Task]) -> None:
-    """Salva a lista de tarefas em JSON (UTF-8) no arquivo de persistência."""
-    DATA_FILE.write_text(json.dumps(tasks, ensure_ascii=False, indent=2), encoding="utf-8")
+    """Salva a lista de tarefas em JSON (UTF-8) no arquivo de persistência.
+
+    O campo `done` de cada registro é calculado aqui a partir de `status`; as tarefas
+    em memória não precisam mantê-lo.
+
+    Usa `orjson` quando disponível (serialização bem mais rápida, já em bytes UTF-8);
+    caso contrário, usa o `json` da biblioteca padrão com o mesmo formato.
+
+    A gravação é atômica: o conteúdo vai para um arquivo temporário ao lado de
+    `DATA_FILE`, que então o substitui via `os.replace`. Uma falha no meio da escrita
+    nunca deixa `tasks.json` truncado.
+
+    Antes da troca, os dados do temporário são levados ao disco com `fdatasync`
+    (ou `fsync`, onde não existir). `fdatasync` não força a gravação de metadados como
+    o mtime, que não importam aqui; assim, após uma queda de energia, `tasks.json`
+    tem o conteúdo antigo ou o novo, nunca um arquivo vazio.
+    """
+    _write_records(_to_records(tasks))
+
+
+def _to_records(tasks: list[Task]) -> list[Task]:
+    """Copia as tarefas no formato gravado em `tasks.json` (com `done` derivado de `status`).
+
+    Registros antigos sem `status` mantêm o `done` que já tinham.
+    """
+    return [{**t, "done": t["status"] == "done" if "status" in t else bool(t.get("done"))}
+            for t in tasks]
+
+
+def _write_records(records: list[Task]) -> None:
+    """Grava registros já no formato final em `DATA_FILE` (ver `save_tasks`)."""
+    tmp = DATA_FILE.with_suffix(".json.tmp")
+    if orjson is not None:
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2))
+            f.flush()
+            _fdatasync(f.fileno())
+    else:
+        # Serializa direto para o arquivo (buffer de 64 KiB), sem montar a string inteira
+        with open(tmp, "w", encoding="utf-8", buffering=1 << 16) as f:
+            json.dump(records, f, ensure_ascii=False, indent=2)
+            f.flush()
+            _fdatasync(f.fileno())
+    os.replace(tmp, DATA_FILE)
 
 
 class TodoApp(tk.Tk):
@@ -147,6 +294,15 @@ class TodoApp(tk.Tk):
         "high": "Alta"
     }
 
+    # Intervalo (ms) usado para agrupar gravações em `tasks.json`
+    SAVE_DELAY_MS = 250
+
+    # Máximo de títulos listados no diálogo de confirmação de deleção em lote
+    MAX_CONFIRM_ITEMS = 20
+
+    # Espera (ms) após a última alteração de busca/filtros antes de reaplicá-los
+    FILTER_DELAY_MS = 150
+
     def __init__(self):
         """Inicializa janela, tema, carrega tarefas, constrói UI e renderiza lista."""
         super().__init__()
@@ -156,10 +312,34 @@ class TodoApp(tk.Tk):
 
         self._apply_theme()
 
-        self.tasks = load_tasks()
-        self._next_id = max([t.get("id", 0) for t in self.tasks], default=0) + 1
-
-        self._normalize_tasks()
+        # Fonte nomeada única compartilhada por todos os RoundedButton da janela
+        self._btn_font = tkfont.Font(self, name="RoundedBtnFont", family="Segoe UI", size=11,
+                                     weight="bold", exists=False)
+
+        # Persistência adiada: mutações marcam `_dirty` e um único save é agendado
+        self._dirty = False
+        self._flush_scheduled = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
+        # A escrita em disco roda em uma thread própria; a fila guarda no máximo o
+        # snapshot mais recente ainda não gravado
+        self._save_queue: queue.Queue[list[Task]] = queue.Queue(maxsize=1)
+        threading.Thread(target=self._saver_loop, name="todo-saver", daemon=True).start()
+
+        self.tasks, needs_save, max_id = load_tasks()
+        self._next_id = max_id + 1
+        if needs_save:
+            self._mark_dirty()
+
+        # Índices por id, mantidos em paralelo com `self.tasks` (fora de `Task` para não
+        # irem ao JSON): a própria tarefa, o título sem espaços nas pontas (exibição e
+        # diálogos) e o título em minúsculas (busca). Atualizados por `_index_task`.
+        self._by_id: dict[int, Task] = {}
+        self._display_text: dict[int, str] = {}
+        self._text_lower: dict[int, str] = {}
+        for task in self.tasks:
+            self._index_task(task)
+        self._filter_job: str | None = None
         
         # Filter variables
         self.filter_status = None  # None = all, "pending", "in_progress", "done"
@@ -169,30 +349,53 @@ class TodoApp(tk.Tk):
         self._build_ui()
         self._refresh_list()
 
-    def _normalize_tasks(self) -> None:
-        """Normaliza tarefas antigas para o formato atual.
+    def _mark_dirty(self) -> None:
+        """Marca as tarefas como alteradas e agenda a gravação em disco.
 
-        Compatibilidade:
-        - Se não houver `status`, deriva de `done` e garante ambos consistentes.
-        - Se não houver `priority`, define como "medium".
-        - Persiste automaticamente se houver mudanças.
+        Rajadas de alterações (ex.: vários cliques seguidos) são agrupadas em uma
+        única gravação após `SAVE_DELAY_MS` (ver `_flush`).
         """
-        updated = False
-        for task in self.tasks:
-            status = task.get("status")
-            if not status:
-                status = "done" if task.get("done") else "pending"
-                task["status"] = status
-                task["done"] = status == "done"
-                updated = True
-            
-            # Add priority if missing
-            if "priority" not in task:
-                task["priority"] = "medium"
-                updated = True
-        
-        if updated:
-            save_tasks(self.tasks)
+        self._dirty = True
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(self.SAVE_DELAY_MS, self._flush)
+
+    def _flush(self) -> None:
+        """Envia as tarefas para gravação se houver alterações pendentes.
+
+        Um snapshot (cópia de cada tarefa já no formato do arquivo, via `_to_records`) é
+        entregue à thread de gravação, então a UI não espera pelo disco e pode continuar
+        alterando `self.tasks`. Se ainda houver um snapshot anterior na fila, ele é
+        descartado: só o mais recente importa.
+        """
+        self._flush_scheduled = False
+        if not self._dirty:
+            return
+        self._dirty = False
+        snapshot = _to_records(self.tasks)
+        try:
+            self._save_queue.get_nowait()
+            self._save_queue.task_done()
+        except queue.Empty:
+            pass
+        self._save_queue.put_nowait(snapshot)
+
+    def _saver_loop(self) -> None:
+        """Laço da thread de gravação: grava cada snapshot recebido com `_write_records`."""
+        while True:
+            snapshot = self._save_queue.get()
+            try:
+                _write_records(snapshot)
+            except Exception:
+                traceback.print_exc()
+            finally:
+                self._save_queue.task_done()
+
+    def _on_close(self) -> None:
+        """Garante a gravação das alterações pendentes antes de fechar a janela."""
+        self._flush()
+        self._save_queue.join()
+        self.destroy()
 
     # Canvas-based rounded button for a softer look
     class RoundedButton(tk.Canvas):
@@ -207,7 +410,11 @@ class TodoApp(tk.Tk):
         - Release: executa `command` se o mouse estiver sobre o widget
         """
 
-        def __init__(self, parent, text, command, bg, fg, hover_bg, active_bg, radius=10, padx=14, pady=8, base_bg=None):
+        # (nome da fonte, texto) → (largura, altura da linha), medidos uma vez só
+        _text_sizes: dict[tuple[str, str], tuple[int, int]] = {}
+
+        def __init__(self, parent, text, command, bg, fg, hover_bg, active_bg, radius=10, padx=14, pady=8, base_bg=None,
+                     *, font):
             """Cria o botão arredondado.
 
             Parâmetros:
@@ -219,10 +426,15 @@ class TodoApp(tk.Tk):
                 radius: Raio aproximado do arredondamento.
                 padx/pady: Espaçamento interno.
                 base_bg: Cor de fundo do Canvas (se omitida, usa background da janela).
+                font: Fonte do texto (ex.: a fonte nomeada compartilhada pela janela).
             """
-            self.font = tkfont.Font(family="Segoe UI", size=11, weight="bold")
-            text_width = self.font.measure(text)
-            text_height = self.font.metrics("linespace")
+            cls = type(self)
+            self.font = font
+            key = (str(font), text)
+            size = cls._text_sizes.get(key)
+            if size is None:
+                size = cls._text_sizes[key] = (font.measure(text), font.metrics("linespace"))
+            text_width, text_height = size
             width = text_width + padx * 2
             height = text_height + pady * 2
             bg_canvas = base_bg if base_bg else parent.winfo_toplevel().cget("background")
@@ -235,18 +447,29 @@ class TodoApp(tk.Tk):
             self.active_bg = active_bg
             self.fg = fg
             self.radius = radius
+            # Tamanho fixo (os botões nunca são redimensionados), usado em `_on_release`
+            self._width = width
+            self._height = height
 
-            self._rect = self._round_rect(2, 2, width - 2, height - 2, radius, fill=self.normal_bg, outline="")
+            self._rect = self._round_rect(self._corner_points(width, height, radius),
+                                          fill=self.normal_bg, outline="")
             self._text = self.create_text(width / 2, height / 2, text=text, fill=self.fg, font=self.font)
 
+            # Atalhos para `_set_bg`, chamado a cada evento de mouse
+            self._tk_call = self.tk.call
+            self._wname = self._w
+
             self.bind("<Enter>", self._on_enter)
             self.bind("<Leave>", self._on_leave)
             self.bind("<ButtonPress-1>", self._on_press)
             self.bind("<ButtonRelease-1>", self._on_release)
 
-        def _round_rect(self, x1: int, y1: int, x2: int, y2: int, r: int, **kwargs: Any) -> int:
-            """Desenha um retângulo arredondado retornando o id do polígono no Canvas."""
-            points = [
+        @staticmethod
+        @lru_cache(maxsize=32)
+        def _corner_points(width: int, height: int, r: int) -> tuple[int, ...]:
+            """Vértices do retângulo arredondado que ocupa o botão (memoizados por geometria)."""
+            x1, y1, x2, y2 = 2, 2, width - 2, height - 2
+            return (
                 x1 + r, y1,
                 x2 - r, y1,
                 x2, y1,
@@ -259,12 +482,18 @@ class TodoApp(tk.Tk):
                 x1, y2 - r,
                 x1, y1 + r,
                 x1, y1,
-            ]
+            )
+
+        def _round_rect(self, points: tuple[int, ...], **kwargs: Any) -> int:
+            """Desenha um retângulo arredondado retornando o id do polígono no Canvas."""
             return self.create_polygon(points, smooth=True, splinesteps=20, **kwargs)
 
         def _set_bg(self, color: str) -> None:
-            """Atualiza a cor de preenchimento do retângulo."""
-            self.itemconfig(self._rect, fill=color)
+            """Atualiza a cor de preenchimento do retângulo.
+
+            Chama o comando Tcl diretamente, sem a conversão de kwargs de `itemconfig`.
+            """
+            self._tk_call(self._wname, "itemconfigure", self._rect, "-fill", color)
 
         def _on_enter(self, _: tk.Event) -> None:
             self._set_bg(self.hover_bg)
@@ -276,9 +505,13 @@ class TodoApp(tk.Tk):
             self._set_bg(self.active_bg)
 
         def _on_release(self, event: tk.Event) -> None:
-            if self.command and self.winfo_containing(event.x_root, event.y_root) == self:
-                self.command()
+            # Teste local de limites com o tamanho guardado (nenhuma ida ao Tk)
+            inside = 0 <= event.x < self._width and 0 <= event.y < self._height
+            # A cor é restaurada antes do comando, que pode destruir o próprio botão
+            # (ex.: botões do diálogo de confirmação)
             self._set_bg(self.hover_bg)
+            if self.command and inside:
+                self.command()
 
     def _apply_theme(self) -> None:
         """Configura paleta e estilos ttk para um tema escuro."""
@@ -325,63 +558,80 @@ class TodoApp(tk.Tk):
             "priority_low_fg": "#374151",
         }
 
+        # Variantes de RoundedButton: (bg, fg, hover_bg, active_bg)
+        self._button_variants = {
+            "accent": (accent, "white", accent_hover, self.colors["accent_active"]),
+            "muted": (card, fg, self.colors["muted_hover"], self.colors["muted_active"]),
+            "danger": (self.colors["danger"], "white", self.colors["danger_hover"], self.colors["danger_active"]),
+        }
+
         # General styling - Unified font system
         font_base = ("Segoe UI", 10)
         font_bold = ("Segoe UI", 10, "bold")
         font_bold_lg = ("Segoe UI", 11, "bold")
         
-        self.style.configure("TFrame", background=surface)
-        self.style.configure("TLabel", background=surface, foreground=fg, font=font_base)
-        self.style.configure("TEntry", fieldbackground=card, foreground=fg, bordercolor=border, 
-                           insertcolor=cursor, font=font_base)
-        self.style.configure("TButton", background=accent, foreground="white", font=font_bold_lg, padding=8)
-        self.style.map("TButton",
-                       background=[("active", accent_hover)],
-                       relief=[("pressed", "sunken"), ("!pressed", "flat")])
-
-        # Treeview styling
-        self.style.configure("Treeview",
-                             background=card,
-                             fieldbackground=card,
-                             foreground=fg,
-                             bordercolor=border,
-                             rowheight=28,
-                             font=font_base)
-        self.style.configure("Treeview.Heading",
-                             background=surface,
-                             foreground=fg,
-                             font=font_bold_lg)
-        self.style.map("Treeview",
-                       background=[("selected", accent)],
-                       foreground=[("selected", "white")])
-        self.style.layout("Treeview", [
-            ("Treeview.treearea", {"sticky": "nswe"})
-        ])
-
-        # Tag styles for statuses
-        self.style.configure("Treeview.Pending", background=self.colors["status_pending_bg"],
-                             foreground=self.colors["status_pending_fg"])
-        self.style.configure("Treeview.Progress", background=self.colors["status_progress_bg"],
-                             foreground=self.colors["status_progress_fg"])
-        self.style.configure("Treeview.Done", background=self.colors["status_done_bg"],
-                             foreground=self.colors["status_done_fg"])
-
-        # Tag styles for priorities
-        self.style.configure("Treeview.PriorityHigh", background=self.colors["priority_high_bg"],
-                             foreground=self.colors["priority_high_fg"])
-        self.style.configure("Treeview.PriorityMedium", background=self.colors["priority_medium_bg"],
-                             foreground=self.colors["priority_medium_fg"])
-        self.style.configure("Treeview.PriorityLow", background=self.colors["priority_low_bg"],
-                             foreground=self.colors["priority_low_fg"])
-
-        # Scrollbar styling
-        self.style.configure("Vertical.TScrollbar",
-                             background=surface,
-                             troughcolor=card,
-                             arrowcolor=fg_muted,
-                             bordercolor=border)
-        self.style.map("Vertical.TScrollbar",
-                       background=[("active", accent_hover)])
+        # Todos os estilos vão para o Tcl em uma única chamada (`theme_settings`), em vez
+        # de um `style.configure`/`style.map` por estilo
+        colors = self.colors
+        self.style.theme_settings("clam", {
+            "TFrame": {"configure": {"background": surface}},
+            "TLabel": {"configure": {"background": surface, "foreground": fg, "font": font_base}},
+            "TEntry": {"configure": {"fieldbackground": card, "foreground": fg, "bordercolor": border,
+                                     "insertcolor": cursor, "font": font_base}},
+            "TButton": {
+                "configure": {"background": accent, "foreground": "white", "font": font_bold_lg, "padding": 8},
+                "map": {"background": [("active", accent_hover)],
+                        "relief": [("pressed", "sunken"), ("!pressed", "flat")]},
+            },
+
+            # Treeview styling
+            "Treeview": {
+                "configure": {"background": card,
+                              "fieldbackground": card,
+                              "foreground": fg,
+                              "bordercolor": border,
+                              "rowheight": 28,
+                              "font": font_base},
+                "map": {"background": [("selected", accent)],
+                        "foreground": [("selected", "white")]},
+                "layout": [("Treeview.treearea", {"sticky": "nswe"})],
+            },
+            "Treeview.Heading": {"configure": {"background": surface,
+                                               "foreground": fg,
+                                               "font": font_bold_lg}},
+
+            # Tag styles for statuses
+            "Treeview.Pending": {"configure": {"background": colors["status_pending_bg"],
+                                               "foreground": colors["status_pending_fg"]}},
+            "Treeview.Progress": {"configure": {"background": colors["status_progress_bg"],
+                                                "foreground": colors["status_progress_fg"]}},
+            "Treeview.Done": {"configure": {"background": colors["status_done_bg"],
+                                            "foreground": colors["status_done_fg"]}},
+
+            # Tag styles for priorities
+            "Treeview.PriorityHigh": {"configure": {"background": colors["priority_high_bg"],
+                                                    "foreground": colors["priority_high_fg"]}},
+            "Treeview.PriorityMedium": {"configure": {"background": colors["priority_medium_bg"],
+                                                      "foreground": colors["priority_medium_fg"]}},
+            "Treeview.PriorityLow": {"configure": {"background": colors["priority_low_bg"],
+                                                   "foreground": colors["priority_low_fg"]}},
+
+            # Scrollbar styling
+            "Vertical.TScrollbar": {
+                "configure": {"background": surface,
+                              "troughcolor": card,
+                              "arrowcolor": fg_muted,
+                              "bordercolor": border},
+                "map": {"background": [("active", accent_hover)]},
+            },
+        })
+
+    def _make_button(self, parent: tk.Widget, text: str, command, variant: str) -> "TodoApp.RoundedButton":
+        """Cria um `RoundedButton` com as cores da variante (`accent`, `muted` ou `danger`)."""
+        bg, fg, hover_bg, active_bg = self._button_variants[variant]
+        return self.RoundedButton(parent, text=text, command=command, bg=bg, fg=fg,
+                                  hover_bg=hover_bg, active_bg=active_bg,
+                                  base_bg=self.colors["surface"], font=self._btn_font)
 
     def _build_ui(self) -> None:
         """Constrói todos os widgets da janela (entrada, preview, lista, ações)."""
@@ -392,7 +642,6 @@ class TodoApp(tk.Tk):
         top = ttk.Frame(main)
         top.pack(fill=tk.X, pady=(0, 12))
 
-        TodoButton = self.RoundedButton
         palette = self.colors
         
         ttk.Label(top, text="Nova tarefa:", font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT)
@@ -414,15 +663,17 @@ class TodoApp(tk.Tk):
             self.priority_var.set(label_to_key.get(priority_input_combo.get(), "medium"))
         priority_input_combo.bind("<<ComboboxSelected>>", on_priority_input_change)
         
-        TodoButton(top, text="Adicionar", command=self.add_task, bg=palette["accent"], fg="white",
-                   hover_bg=palette["accent_hover"], active_bg=palette["accent_active"],
-                   base_bg=palette["surface"]).pack(side=tk.LEFT, padx=(6, 0))
-
-        # Preview area to show texto completo da tarefa selecionada
-        self.preview = tk.Text(main, height=4, wrap="word", bg=palette["card"], fg=palette["fg"],
-                       insertbackground=palette["cursor"], relief="flat", padx=10, pady=8)
-        self.preview.config(state="disabled")
-        self.preview.pack(fill=tk.X, pady=(8, 12))
+        self._make_button(top, "Adicionar", self.add_task, "accent").pack(side=tk.LEFT, padx=(6, 0))
+
+        # Preview area to show texto completo da tarefa selecionada.
+        # O tk.Text só é criado na primeira seleção (`_create_preview`); até lá, um
+        # Frame com a mesma cor e altura reserva o espaço para o layout não mudar.
+        linespace = tkfont.nametofont("TkFixedFont").metrics("linespace")
+        self._preview_slot = tk.Frame(main, height=linespace * 4 + 2 * 8 + 4, bg=palette["card"])
+        self._preview_slot.pack_propagate(False)
+        self._preview_slot.pack(fill=tk.X, pady=(8, 12))
+        self.preview: tk.Text | None = None
+        self._preview_has_text = False
 
         # Dashboard de Estatísticas
         dashboard = ttk.Frame(main)
@@ -457,7 +708,7 @@ class TodoApp(tk.Tk):
         # Busca por texto
         ttk.Label(filter_frame, text="🔍 Buscar:", font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT)
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", lambda *args: self._apply_filters())
+        self.search_var.trace("w", lambda *args: self._schedule_filter())
         search_entry = ttk.Entry(filter_frame, textvariable=self.search_var, font=("Segoe UI", 10), width=20)
         search_entry.pack(side=tk.LEFT, padx=8)
         
@@ -467,7 +718,7 @@ class TodoApp(tk.Tk):
         # Filtro por Status
         ttk.Label(filter_frame, text="Status:", font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT)
         self.status_var = tk.StringVar(value="all")
-        self.status_var.trace("w", lambda *args: self._apply_filters())
+        self.status_var.trace("w", lambda *args: self._schedule_filter())
         status_values = ["Todos", "Pendentes", "Em andamento", "Concluídas"]
         status_combo = ttk.Combobox(filter_frame, values=status_values,
                                     state="readonly", width=15, font=("Segoe UI", 10))
@@ -482,7 +733,7 @@ class TodoApp(tk.Tk):
         # Filtro por Prioridade
         ttk.Label(filter_frame, text="Prioridade:", font=("Segoe UI", 10, "bold")).pack(side=tk.LEFT, padx=(16, 0))
         self.priority_filter_var = tk.StringVar(value="all")
-        self.priority_filter_var.trace("w", lambda *args: self._apply_filters())
+        self.priority_filter_var.trace("w", lambda *args: self._schedule_filter())
         priority_values = ["Todas", "Alta", "Média", "Baixa"]
         priority_combo = ttk.Combobox(filter_frame, values=priority_values,
                                       state="readonly", width=12, font=("Segoe UI", 10))
@@ -517,6 +768,20 @@ class TodoApp(tk.Tk):
         self.tree.bind("<<TreeviewSelect>>", self._update_preview)
         self.tree.bind("<Button-1>", self._on_tree_click)
 
+        # Posição x (em pixels de conteúdo) onde começa a coluna delete; recalculada
+        # quando o Treeview muda de tamanho ou uma coluna é redimensionada
+        self._xview_first = 0.0
+        self._resizing_column = False
+        self._update_delete_col_x()
+        self.tree.bind("<Configure>", lambda _: self.after_idle(self._update_delete_col_x))
+        self.tree.bind("<ButtonRelease-1>", self._on_tree_release)
+
+        self.tk.eval(_BULK_INSERT_SCRIPT)
+
+        # Último estado aplicado ao Treeview (usado por `_sync_tree`)
+        self._rendered: dict[str, tuple[tuple[str, ...], tuple[str, ...]]] = {}
+        self._order: list[str] = []
+
         # Color tags for statuses
         self.tree.tag_configure("pending", background=palette["status_pending_bg"],
                                 foreground=palette["status_pending_fg"])
@@ -533,90 +798,179 @@ class TodoApp(tk.Tk):
         self.tree.tag_configure("priority_low", background=palette["priority_low_bg"],
                                 foreground=palette["priority_low_fg"])
 
-        scrollbar_y = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
-        scrollbar_x = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
-        self.tree.configure(yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
-        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-        scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        self._scrollbar_y = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self._scrollbar_x = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL, command=self.tree.xview)
+        # Comandos de rolagem criados uma única vez; `_sync_tree` os reaproveita ao religar
+        # a rolagem. O vertical vai direto ao comando Tcl da barra, sem passar pelo Python;
+        # só o horizontal precisa de `_on_tree_xscroll` (guarda o deslocamento).
+        self._yscroll_cmd = f"{self._scrollbar_y} set"
+        self._xscroll_cmd = self.register(self._on_tree_xscroll)
+        self.tree.configure(yscrollcommand=self._yscroll_cmd, xscrollcommand=self._xscroll_cmd)
+        self._scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self._scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
 
         # Barra de ações
         actions = ttk.Frame(main)
         actions.pack(fill=tk.X, pady=(12, 0))
 
-        TodoButton(actions, text="Concluir", command=lambda: self.set_status("done"), bg=palette["accent"], fg="white",
-               hover_bg=palette["accent_hover"], active_bg=palette["accent_active"],
-               base_bg=palette["surface"]).pack(side=tk.LEFT)
-        TodoButton(actions, text="Em andamento", command=lambda: self.set_status("in_progress"), bg=palette["card"], fg=palette["fg"],
-               hover_bg=palette["muted_hover"], active_bg=palette["muted_active"],
-               base_bg=palette["surface"]).pack(side=tk.LEFT, padx=8)
-        TodoButton(actions, text="Reabrir", command=lambda: self.set_status("pending"), bg=palette["card"], fg=palette["fg"],
-               hover_bg=palette["muted_hover"], active_bg=palette["muted_active"],
-               base_bg=palette["surface"]).pack(side=tk.LEFT, padx=(0, 8))
-        TodoButton(actions, text="Remover", command=self.remove_selected, bg=palette["danger"], fg="white",
-                   hover_bg=palette["danger_hover"], active_bg=palette["danger_active"],
-                   base_bg=palette["surface"]).pack(side=tk.LEFT)
+        self._make_button(actions, "Concluir", lambda: self.set_status("done"), "accent").pack(side=tk.LEFT)
+        self._make_button(actions, "Em andamento", lambda: self.set_status("in_progress"), "muted").pack(side=tk.LEFT, padx=8)
+        self._make_button(actions, "Reabrir", lambda: self.set_status("pending"), "muted").pack(side=tk.LEFT, padx=(0, 8))
+        self._make_button(actions, "Remover", self.remove_selected, "danger").pack(side=tk.LEFT)
+
+    def _render_task(self, task: Task) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Monta os `values` e as `tags` da linha do Treeview para uma tarefa."""
+        display = self._display_text[task["id"]] or "(sem título)"
+
+        status_label, status_tag = STATUS_DISPLAY.get(task.get("status", "pending"),
+                                                      STATUS_DISPLAY["done"])
+        priority_label, priority_tag = PRIORITY_DISPLAY.get(task.get("priority", "medium"),
+                                                            PRIORITY_DISPLAY["low"])
+
+        return (display, priority_label, status_label, "×"), (status_tag, priority_tag)
+
+    def _sync_tree(self, order: list[str],
+                   rows: dict[str, tuple[tuple[str, ...], tuple[str, ...]]]) -> None:
+        """Aplica no Treeview apenas as diferenças em relação à última renderização.
+
+        Parâmetros:
+            order: iids das linhas na ordem em que devem aparecer.
+            rows: `values` e `tags` desejados para cada iid de `order`.
+
+        Linhas novas são inseridas, linhas que sumiram são removidas e apenas as
+        linhas cujo conteúdo mudou são atualizadas; a ordem só é reaplicada (em uma
+        única chamada) quando difere da atual. Isso preserva seleção e rolagem.
+        Várias linhas novas são inseridas de uma vez pelo proc `_BULK_INSERT_PROC`.
+
+        Quando o Treeview está vazio (carga inicial), as barras de rolagem e o
+        `stretch` da coluna de tarefa ficam desligados durante as inserções, e o
+        layout é recalculado uma única vez no final.
+        """
+        tree = self.tree
+        rendered = self._rendered
+        bulk = not rendered and len(order) > 1
+        if bulk:
+            tree.configure(yscrollcommand="", xscrollcommand="")
+            tree.column("task", stretch=False)
+
+        stale = [iid for iid in rendered if iid not in rows]
+        if stale:
+            tree.delete(*stale)
+            for iid in stale:
+                del rendered[iid]
+
+        current = [iid for iid in self._order if iid in rows]
+        new_rows: list[Any] = []
+        for iid in order:
+            row = rows[iid]
+            previous = rendered.get(iid)
+            if previous is None:
+                new_rows += (iid, row[0], row[1])
+                current.append(iid)
+            elif previous != row:
+                tree.item(iid, values=row[0], tags=row[1])
+            rendered[iid] = row
+
+        if len(new_rows) == 3:
+            tree.insert("", tk.END, iid=new_rows[0], values=new_rows[1], tags=new_rows[2])
+        elif new_rows:
+            self.tk.call(_BULK_INSERT_PROC, tree, tuple(new_rows))
+
+        if current != order:
+            tree.set_children("", *order)
+        self._order = order
+
+        if bulk:
+            tree.column("task", stretch=True)
+            tree.configure(yscrollcommand=self._yscroll_cmd, xscrollcommand=self._xscroll_cmd)
+            tree.update_idletasks()
 
     def _refresh_list(self) -> None:
-        """Re-renderiza o Treeview com base em `self.tasks` e atualiza o preview.
+        """Sincroniza o Treeview com `self.tasks` e atualiza o preview.
         
         Ordena as tarefas por prioridade (high > medium > low) e depois por ID.
         Aplica os filtros de status, prioridade e busca.
+
+        Filtro, chave de ordenação e contagem por status (para o dashboard) são
+        calculados em uma única passada sobre `self.tasks`.
         """
-        # Apply filters
         status_filter = self.filter_status
         priority_filter = self.filter_priority
-        search_text = self.filter_search
+        search_lower = self.filter_search.lower().strip()
+        text_lower = self._text_lower
         
-        filtered_tasks = filter_tasks(self.tasks, status_filter, priority_filter, search_text)
-        
-        # Sort tasks by priority (high=0, medium=1, low=2) and then by id
-        priority_order = {"high": 0, "medium": 1, "low": 2}
-        sorted_tasks = sorted(filtered_tasks, 
-                             key=lambda t: (priority_order.get(t.get("priority", "medium"), 1), t.get("id", 0)))
+        # Sort tasks by priority (see `_PRIORITY_RANK`) and then by id
+        rank = _PRIORITY_RANK.get
+        counts: dict[str | None, int] = {}
+        keyed = []
+        for task in self.tasks:
+            status_val = task.get("status")
+            counts[status_val] = counts.get(status_val, 0) + 1
+            # Mesmos critérios de `filter_tasks`, testados em linha (sem chamada por tarefa)
+            if ((not status_filter or status_val == status_filter)
+                    and (not priority_filter or task.get("priority") == priority_filter)
+                    and (not search_lower or search_lower in text_lower[task["id"]])):
+                keyed.append((rank(task.get("priority", "medium"), 1), task.get("id", 0), task))
+        keyed.sort(key=itemgetter(0, 1))
         
-        self.tree.delete(*self.tree.get_children())
-        for task in sorted_tasks:
-            status_val = task.get("status", "pending")
-            priority_val = task.get("priority", "medium")
-            task["done"] = status_val == "done"
-
-            display = task["task"].strip() or "(sem título)"
-            
-            # Status label and tag
-            if status_val == "pending":
-                status_label = "Pendente"
-                status_tag = "pending"
-            elif status_val == "in_progress":
-                status_label = "Em andamento"
-                status_tag = "in_progress"
-            else:
-                status_label = "Feita"
-                status_tag = "done"
-            
-            # Priority label and tag
-            if priority_val == "high":
-                priority_label = "Alta"
-                priority_tag = "priority_high"
-            elif priority_val == "medium":
-                priority_label = "Média"
-                priority_tag = "priority_medium"
-            else:
-                priority_label = "Baixa"
-                priority_tag = "priority_low"
-            
-            tags = (status_tag, priority_tag)
-            self.tree.insert("", tk.END, iid=str(task["id"]), 
-                           values=(display, priority_label, status_label, "×"), 
-                           tags=tags)
+        order = []
+        rows = {}
+        append = order.append
+        render = self._render_task
+        for _, _, task in keyed:
+            iid = str(task["id"])
+            append(iid)
+            rows[iid] = render(task)
+        self._sync_tree(order, rows)
 
         # Update preview text with current selection
         self._update_preview()
         
         # Update dashboard statistics
-        self._update_dashboard()
+        self._update_dashboard(_stats_from_counts(counts, len(self.tasks)))
         
         # Update filter result count
-        self._update_filter_label(len(sorted_tasks))
+        self._update_filter_label(len(keyed))
+
+    def _refresh_rows(self, ids: Iterable[int]) -> None:
+        """Atualiza apenas as linhas das tarefas informadas após uma mudança de status.
+
+        Status não afeta a ordenação nem os filtros de busca/prioridade, então basta
+        re-renderizar essas linhas e o dashboard; seleção e rolagem ficam intactas. Com
+        um filtro de status ativo, as linhas podem entrar ou sair da lista, e então a
+        atualização completa (`_refresh_list`) é usada.
+        """
+        if self.filter_status:
+            self._refresh_list()
+            return
+        rendered = self._rendered
+        for task_id in ids:
+            task = self._by_id.get(task_id)
+            iid = str(task_id)
+            if task is None or iid not in rendered:
+                continue
+            row = self._render_task(task)
+            if rendered[iid] != row:
+                self.tree.item(iid, values=row[0], tags=row[1])
+                rendered[iid] = row
+        self._update_dashboard(calculate_stats(self.tasks))
+
+    def _on_tree_xscroll(self, first: str, last: str) -> None:
+        """Repasse da rolagem horizontal do Treeview: atualiza a barra e guarda o deslocamento."""
+        self._xview_first = float(first)
+        self._scrollbar_x.set(first, last)
+
+    def _update_delete_col_x(self) -> None:
+        """Recalcula onde começa a coluna delete, a partir das larguras atuais das colunas."""
+        widths = [self.tree.column(column, "width") for column in self.tree["columns"]]
+        self._columns_width = sum(widths)
+        self._delete_col_x = self._columns_width - widths[-1]
+
+    def _on_tree_release(self, _: tk.Event) -> None:
+        """Recalcula a posição da coluna delete somente ao fim de um redimensionamento de coluna."""
+        if self._resizing_column:
+            self._resizing_column = False
+            self.after_idle(self._update_delete_col_x)
 
     def _on_tree_click(self, event: tk.Event) -> None:
         """Handler de clique no Treeview.
@@ -624,50 +978,89 @@ class TodoApp(tk.Tk):
         Se clicar na coluna de delete ("×"), pede confirmação antes de remover.
         """
         region = self.tree.identify_region(event.x, event.y)
+        # Clique no separador de cabeçalhos: coluna pode ser redimensionada (ver `_on_tree_release`)
+        self._resizing_column = region == "separator"
         if region == "cell":
-            column = self.tree.identify_column(event.x)
-            if column == "#4":  # Coluna delete (task=#1, priority=#2, status=#3, delete=#4)
+            # Coluna delete é a última; compara com a posição pré-calculada em vez de `identify_column`
+            if event.x + self._xview_first * self._columns_width >= self._delete_col_x:
                 item = self.tree.identify_row(event.y)
                 if item:
                     task_id = int(item)
-                    # Find the task to get its text
-                    task_text = ""
-                    for task in self.tasks:
-                        if task["id"] == task_id:
-                            task_text = task.get("task", "").strip()
-                            break
+                    task_text = self._display_text.get(task_id, "")
                     
                     # Ask for confirmation
                     confirm_msg = f"Deletar esta tarefa?\n\n{task_text}"
-                    if messagebox.askyesno("Confirmar Deleção", confirm_msg):
-                        self.tasks = [t for t in self.tasks if t["id"] != task_id]
-                        save_tasks(self.tasks)
-                        self._refresh_list()
+                    self._confirm_delete(confirm_msg, lambda: self._delete_ids(frozenset((task_id,))))
+
+    def _index_task(self, task: Task) -> None:
+        """Registra a tarefa nos índices por id (`_by_id`, `_display_text`, `_text_lower`)."""
+        task_id = task["id"]
+        text = task.get("task", "")
+        self._by_id[task_id] = task
+        self._display_text[task_id] = text.strip()
+        self._text_lower[task_id] = text.lower()
+
+    def _remove_ids(self, ids: frozenset[int]) -> None:
+        """Remove as tarefas com os ids informados de `self.tasks` e do índice `_by_id`.
+
+        A lista é alterada no lugar, mantendo a mesma identidade de `self.tasks`. O caso
+        comum (uma única tarefa, ex.: clique no "×") usa `list.remove`, sem montar uma
+        lista nova; remoções em lote filtram a lista uma única vez.
+        """
+        by_id = self._by_id
+        display_text = self._display_text
+        text_lower = self._text_lower
+        removed = []
+        for task_id in ids:
+            task = by_id.pop(task_id, None)
+            display_text.pop(task_id, None)
+            text_lower.pop(task_id, None)
+            if task is not None:
+                removed.append(task)
+        if len(removed) == 1:
+            self.tasks.remove(removed[0])
+        elif removed:
+            self.tasks[:] = [t for t in self.tasks if t["id"] not in ids]
 
     def _selection_ids(self) -> list[int]:
         """Retorna os ids selecionados no Treeview como `int`."""
         return [int(item) for item in self.tree.selection()]
 
+    def _create_preview(self) -> None:
+        """Cria o widget de preview (tk.Text) dentro do espaço reservado em `_build_ui`."""
+        palette = self.colors
+        self.preview = tk.Text(self._preview_slot, height=4, wrap="word", bg=palette["card"], fg=palette["fg"],
+                               insertbackground=palette["cursor"], relief="flat", padx=10, pady=8)
+        self.preview.config(state="disabled")
+        self.preview.pack(fill=tk.BOTH, expand=True)
+
+    def _selection_id_set(self) -> frozenset[int]:
+        """Retorna os ids selecionados como `frozenset` (para quem só precisa de pertinência)."""
+        return frozenset(map(int, self.tree.selection()))
+
     def _update_preview(self, *_: Any) -> None:
-        """Atualiza a área de preview com o texto completo da primeira tarefa selecionada."""
+        """Atualiza a área de preview com o texto completo da primeira tarefa selecionada.
+
+        Sem seleção e com o preview já vazio não há nada a fazer, e o widget não é tocado.
+        """
         selection = self._selection_ids()
+        if not selection and not self._preview_has_text:
+            return
         text = ""
         if selection:
             # show first selected task's text
-            task_id = selection[0]
-            for task in self.tasks:
-                if task["id"] == task_id:
-                    text = task.get("task", "").strip()
-                    break
+            text = self._display_text.get(selection[0], "")
+        if self.preview is None:
+            self._create_preview()
         self.preview.config(state="normal")
         self.preview.delete("1.0", tk.END)
         if text:
             self.preview.insert("1.0", text)
         self.preview.config(state="disabled")
+        self._preview_has_text = bool(text)
 
-    def _update_dashboard(self) -> None:
-        """Atualiza os labels de estatísticas do dashboard."""
-        stats = calculate_stats(self.tasks)
+    def _update_dashboard(self, stats: dict[str, int | float]) -> None:
+        """Atualiza os labels de estatísticas do dashboard (`stats` no formato de `calculate_stats`)."""
         
         self.label_total.config(text=f"Total: {stats['total']}")
         self.label_pending.config(text=f"Pendentes: {stats['pending']}")
@@ -677,8 +1070,19 @@ class TodoApp(tk.Tk):
         completion_pct = int(stats['completion_percent'])
         self.label_completion.config(text=f"Progresso: {completion_pct}%")
 
+    def _schedule_filter(self) -> None:
+        """Agenda `_apply_filters`, reiniciando a espera a cada chamada.
+
+        Usado pelas variáveis de busca, status e prioridade: várias alterações seguidas
+        (ex.: digitação rápida) resultam em um único `_refresh_list`.
+        """
+        if self._filter_job is not None:
+            self.after_cancel(self._filter_job)
+        self._filter_job = self.after(self.FILTER_DELAY_MS, self._apply_filters)
+
     def _apply_filters(self) -> None:
         """Aplica os filtros baseado nas seleções do usuário."""
+        self._filter_job = None
         # Update filter variables from UI
         search_text = self.search_var.get()
         status_val = self.status_var.get()
@@ -707,79 +1111,125 @@ class TodoApp(tk.Tk):
             messagebox.showinfo("Aviso", "Digite uma tarefa antes de adicionar.")
             return
         priority = self.priority_var.get()
-        self.tasks.append({
+        task: Task = {
             "id": self._next_id, 
             "task": text, 
-            "done": False, 
             "status": "pending",
             "priority": priority
-        })
+        }
+        self.tasks.append(task)
+        self._index_task(task)
         self._next_id += 1
-        save_tasks(self.tasks)
+        self._mark_dirty()
         self.entry.delete(0, tk.END)
         self._refresh_list()
 
     def set_status(self, status: TaskStatus) -> None:
         """Define o status para todas as tarefas selecionadas.
 
+        Tarefas que já têm esse status são ignoradas; se nenhuma mudar (ex.: clicar
+        duas vezes em "Concluir"), nada é salvo nem redesenhado.
+
         Parâmetros:
             status: Um de `pending`, `in_progress`, `done`.
         """
-        ids = self._selection_ids()
+        ids = self._selection_id_set()
         if not ids:
             return
-        valid = {"pending", "in_progress", "done"}
-        if status not in valid:
+        if status not in _VALID_STATUSES:
             return
-        for task in self.tasks:
-            if task["id"] in ids:
+        changed = []
+        for task_id in ids:
+            task = self._by_id.get(task_id)
+            if task and task.get("status") != status:
                 task["status"] = status
-                task["done"] = status == "done"
-        save_tasks(self.tasks)
-        self._refresh_list()
+                changed.append(task_id)
+        if not changed:
+            return
+        self._mark_dirty()
+        self._refresh_rows(changed)
 
     def toggle_selected(self) -> None:
         """Alterna o status da seleção em ciclo: pending → in_progress → done → pending."""
-        ids = self._selection_ids()
+        ids = self._selection_id_set()
         if not ids:
             return
-        for task in self.tasks:
-            if task["id"] in ids:
-                current = task.get("status", "pending")
-                if current == "pending":
-                    task["status"] = "in_progress"
-                elif current == "in_progress":
-                    task["status"] = "done"
-                else:
-                    task["status"] = "pending"
-                task["done"] = task["status"] == "done"
-        save_tasks(self.tasks)
-        self._refresh_list()
+        for task_id in ids:
+            task = self._by_id.get(task_id)
+            if not task:
+                continue
+            task["status"] = _NEXT_STATUS.get(task.get("status", "pending"), "pending")
+        self._mark_dirty()
+        self._refresh_rows(ids)
 
     def remove_selected(self) -> None:
-        """Remove todas as tarefas selecionadas após confirmação (com persistência imediata)."""
-        ids = set(self._selection_ids())
+        """Pede confirmação e remove todas as tarefas selecionadas (agendando a persistência)."""
+        ids = self._selection_id_set()
         if not ids:
             return
         
         # Build list of tasks to be deleted for confirmation
-        tasks_to_delete = []
-        for task in self.tasks:
-            if task["id"] in ids:
-                tasks_to_delete.append(task.get("task", "").strip())
+        display_text = self._display_text
+        tasks_to_delete = [display_text[task_id] for task_id in ids if task_id in display_text]
         
-        # Ask for confirmation
+        # Ask for confirmation (listing at most MAX_CONFIRM_ITEMS titles)
         count = len(tasks_to_delete)
         if count == 1:
             confirm_msg = f"Deletar esta tarefa?\n\n{tasks_to_delete[0]}"
         else:
-            task_list = "\n".join([f"• {t}" for t in tasks_to_delete])
+            limit = self.MAX_CONFIRM_ITEMS
+            task_list = "\n".join(f"• {t}" for t in tasks_to_delete[:limit])
+            if count > limit:
+                task_list += f"\n… e mais {count - limit}"
             confirm_msg = f"Deletar {count} tarefas?\n\n{task_list}"
         
-        if messagebox.askyesno("Confirmar Deleção", confirm_msg):
-            self.tasks = [t for t in self.tasks if t["id"] not in ids]
-            save_tasks(self.tasks)
-            self._refresh_list()
+        self._confirm_delete(confirm_msg, lambda: self._delete_ids(ids))
+
+    def _delete_ids(self, ids: frozenset[int]) -> None:
+        """Remove as tarefas informadas, agenda a persistência e atualiza a lista."""
+        self._remove_ids(ids)
+        self._mark_dirty()
+        self._refresh_list()
+
+    def _confirm_delete(self, message: str, on_yes: Callable[[], None]) -> None:
+        """Mostra o diálogo de confirmação de deleção sem bloquear o loop de eventos.
+
+        Ao contrário de `messagebox.askyesno`, não roda um loop de eventos aninhado: o
+        método retorna na hora e `on_yes` é chamado pelo botão "Deletar". O diálogo
+        captura a entrada (grab) enquanto estiver aberto, como um modal.
+        """
+        dialog = tk.Toplevel(self, bg=self.colors["surface"])
+        # Fica oculto até ser posicionado, para não aparecer antes no lugar padrão
+        dialog.withdraw()
+        dialog.title("Confirmar Deleção")
+        dialog.resizable(False, False)
+        dialog.transient(self)
+
+        body = ttk.Frame(dialog, padding=16)
+        body.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(body, text=message, wraplength=420, justify=tk.LEFT).pack(anchor=tk.W)
+
+        def confirm() -> None:
+            dialog.destroy()
+            on_yes()
+
+        buttons = ttk.Frame(body)
+        buttons.pack(fill=tk.X, pady=(16, 0))
+        self._make_button(buttons, "Cancelar", dialog.destroy, "muted").pack(side=tk.RIGHT)
+        self._make_button(buttons, "Deletar", confirm, "danger").pack(side=tk.RIGHT, padx=(0, 8))
+
+        dialog.bind("<Return>", lambda _: confirm())
+        dialog.bind("<Escape>", lambda _: dialog.destroy())
+        # O grab só pode ser feito quando a janela estiver visível
+        dialog.bind("<Map>", lambda event: dialog.grab_set() if event.widget is dialog else None)
+
+        # Centraliza sobre a janela principal, como fazia o `messagebox`
+        dialog.update_idletasks()
+        x = self.winfo_rootx() + (self.winfo_width() - dialog.winfo_reqwidth()) // 2
+        y = self.winfo_rooty() + (self.winfo_height() - dialog.winfo_reqheight()) // 2
+        dialog.geometry(f"+{max(x, 0)}+{max(y, 0)}")
+        dialog.deiconify()
+        dialog.focus_set()
 
 
 if __name__ == "__main__":